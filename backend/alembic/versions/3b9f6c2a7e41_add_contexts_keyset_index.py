@@ -0,0 +1,30 @@
+"""Add contexts keyset pagination index
+
+Revision ID: 3b9f6c2a7e41
+Revises: dd7a873a1c1d
+Create Date: 2026-10-15 09:12:04.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f6c2a7e41'
+down_revision: Union[str, Sequence[str], None] = 'dd7a873a1c1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.create_index('idx_contexts_created_id', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.drop_index('idx_contexts_created_id')
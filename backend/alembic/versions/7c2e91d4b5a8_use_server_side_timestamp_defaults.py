@@ -0,0 +1,70 @@
+"""Use server-side timestamp defaults
+
+Revision ID: 7c2e91d4b5a8
+Revises: 3b9f6c2a7e41
+Create Date: 2026-10-15 10:03:47.562914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e91d4b5a8'
+down_revision: Union[str, Sequence[str], None] = '3b9f6c2a7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _restore_keyset_index() -> None:
+    """Recreate idx_contexts_created_id after a SQLite batch rebuild of contexts.
+
+    Batch mode reflects indexes without their column directions, so the
+    rebuilt table gets (created_at, id) instead of the DESC/DESC keyset order.
+    """
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.drop_index('idx_contexts_created_id', table_name='contexts')
+    op.create_index(
+        'idx_contexts_created_id', 'contexts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def _utcnow() -> sa.TextClause:
+    """Current UTC timestamp expression for the connected dialect."""
+    if op.get_bind().dialect.name == "sqlite":
+        return sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))")
+    return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    utcnow = _utcnow()
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=utcnow)
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=utcnow)
+    _restore_keyset_index()
+
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=utcnow)
+
+    with op.batch_alter_table('api_usage', schema=None) as batch_op:
+        batch_op.alter_column('request_timestamp', existing_type=sa.DateTime(), server_default=utcnow)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('api_usage', schema=None) as batch_op:
+        batch_op.alter_column('request_timestamp', existing_type=sa.DateTime(), server_default=None)
+
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), server_default=None)
+    _restore_keyset_index()
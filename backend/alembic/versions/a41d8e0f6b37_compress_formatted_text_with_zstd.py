@@ -0,0 +1,73 @@
+"""Compress formatted_text with zstd
+
+Revision ID: a41d8e0f6b37
+Revises: 7c2e91d4b5a8
+Create Date: 2026-10-15 11:52:19.304877
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d8e0f6b37'
+down_revision: Union[str, Sequence[str], None] = '7c2e91d4b5a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _restore_keyset_index() -> None:
+    """Recreate idx_contexts_created_id after a SQLite batch rebuild of contexts.
+
+    Batch mode reflects indexes without their column directions, so the
+    rebuilt table gets (created_at, id) instead of the DESC/DESC keyset order.
+    """
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.drop_index('idx_contexts_created_id', table_name='contexts')
+    op.create_index(
+        'idx_contexts_created_id', 'contexts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('formatted_text_zstd', sa.LargeBinary(), nullable=True))
+        batch_op.alter_column('formatted_text', existing_type=sa.Text(), nullable=True)
+    _restore_keyset_index()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Rows written after the upgrade only carry compressed text; restore the
+    # plain column before it becomes NOT NULL again
+    contexts = sa.table(
+        'contexts',
+        sa.column('id'),
+        sa.column('formatted_text', sa.Text()),
+        sa.column('formatted_text_zstd', sa.LargeBinary()),
+    )
+    bind = op.get_bind()
+    decompressor = zstandard.ZstdDecompressor()
+    rows = bind.execute(
+        sa.select(contexts.c.id, contexts.c.formatted_text_zstd)
+        .where(contexts.c.formatted_text.is_(None))
+        .where(contexts.c.formatted_text_zstd.isnot(None))
+    ).fetchall()
+    for context_id, compressed in rows:
+        bind.execute(
+            contexts.update()
+            .where(contexts.c.id == context_id)
+            .values(formatted_text=decompressor.decompress(compressed).decode('utf-8'))
+        )
+
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.alter_column('formatted_text', existing_type=sa.Text(), nullable=False)
+        batch_op.drop_column('formatted_text_zstd')
+    _restore_keyset_index()
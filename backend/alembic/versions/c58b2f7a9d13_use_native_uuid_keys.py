@@ -0,0 +1,100 @@
+"""Use native UUID type for context and message keys
+
+Revision ID: c58b2f7a9d13
+Revises: a41d8e0f6b37
+Create Date: 2026-10-15 12:04:51.870263
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58b2f7a9d13'
+down_revision: Union[str, Sequence[str], None] = 'a41d8e0f6b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding UUIDs
+UUID_COLUMNS = [
+    ('contexts', 'id'),
+    ('messages', 'id'),
+    ('messages', 'context_id'),
+]
+
+
+def _restore_keyset_index() -> None:
+    """Recreate idx_contexts_created_id after a SQLite batch rebuild of contexts.
+
+    Batch mode reflects indexes without their column directions, so the
+    rebuilt table gets (created_at, id) instead of the DESC/DESC keyset order.
+    """
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.drop_index('idx_contexts_created_id', table_name='contexts')
+    op.create_index(
+        'idx_contexts_created_id', 'contexts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint('messages_context_id_fkey', 'messages', type_='foreignkey')
+        for table, column in UUID_COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.String(length=36),
+                type_=sa.Uuid(),
+                postgresql_using=f'{column}::uuid',
+            )
+        op.create_foreign_key(
+            'messages_context_id_fkey', 'messages', 'contexts',
+            ['context_id'], ['id'], ondelete='CASCADE',
+        )
+        return
+
+    # Non-native backends store Uuid as 32-char hex without dashes
+    for table, column in UUID_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = REPLACE({column}, '-', '')")
+    for table in ('contexts', 'messages'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for t, column in UUID_COLUMNS:
+                if t == table:
+                    batch_op.alter_column(column, existing_type=sa.String(length=36), type_=sa.Uuid())
+    _restore_keyset_index()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint('messages_context_id_fkey', 'messages', type_='foreignkey')
+        for table, column in UUID_COLUMNS:
+            op.alter_column(
+                table, column,
+                existing_type=sa.Uuid(),
+                type_=sa.String(length=36),
+                postgresql_using=f'{column}::text',
+            )
+        op.create_foreign_key(
+            'messages_context_id_fkey', 'messages', 'contexts',
+            ['context_id'], ['id'], ondelete='CASCADE',
+        )
+        return
+
+    for table in ('contexts', 'messages'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for t, column in UUID_COLUMNS:
+                if t == table:
+                    batch_op.alter_column(column, existing_type=sa.Uuid(), type_=sa.String(length=36))
+    _restore_keyset_index()
+    for table, column in UUID_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = "
+            f"SUBSTR({column}, 1, 8) || '-' || SUBSTR({column}, 9, 4) || '-' || "
+            f"SUBSTR({column}, 13, 4) || '-' || SUBSTR({column}, 17, 4) || '-' || SUBSTR({column}, 21)"
+        )
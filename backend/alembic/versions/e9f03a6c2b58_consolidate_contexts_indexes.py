@@ -0,0 +1,66 @@
+"""Consolidate contexts indexes
+
+Revision ID: e9f03a6c2b58
+Revises: c58b2f7a9d13
+Create Date: 2026-10-15 12:21:36.042719
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9f03a6c2b58'
+down_revision: Union[str, Sequence[str], None] = 'c58b2f7a9d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _restore_keyset_index() -> None:
+    """Recreate idx_contexts_created_id after a SQLite batch rebuild of contexts.
+
+    Batch mode reflects indexes without their column directions, so the
+    rebuilt table gets (created_at, id) instead of the DESC/DESC keyset order.
+    """
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.drop_index('idx_contexts_created_id', table_name='contexts')
+    op.create_index(
+        'idx_contexts_created_id', 'contexts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.drop_index('ix_contexts_platform')
+        batch_op.drop_index('ix_contexts_created_at')
+        batch_op.drop_index('ix_contexts_expires_at')
+        batch_op.create_index(
+            'idx_platform_created',
+            ['platform', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+        )
+        batch_op.create_index(
+            'idx_expires_partial',
+            ['expires_at'],
+            unique=False,
+            postgresql_where=sa.text('expires_at IS NOT NULL'),
+            sqlite_where=sa.text('expires_at IS NOT NULL'),
+        )
+    _restore_keyset_index()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('contexts', schema=None) as batch_op:
+        batch_op.drop_index('idx_expires_partial')
+        batch_op.drop_index('idx_platform_created')
+        batch_op.create_index('ix_contexts_expires_at', ['expires_at'], unique=False)
+        batch_op.create_index('ix_contexts_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_contexts_platform', ['platform'], unique=False)
+    _restore_keyset_index()
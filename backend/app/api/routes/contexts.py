@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+from uuid import UUID
 import logging
 
 from app.database import get_db
@@ -18,9 +19,17 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/contexts", response_model=ContextCreateResponse, status_code=201)
+@router.post(
+    "/contexts",
+    response_model=ContextCreateResponse,
+    status_code=201,
+    responses={202: {"description": "Context saved, AI summary is being generated"}},
+)
 async def create_context(
-    context: ContextCreate, db: AsyncSession = Depends(get_db)
+    context: ContextCreate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Save a new context with messages.
@@ -29,16 +38,29 @@ async def create_context(
     - **messages**: Array of conversation messages
     - **formatted**: Markdown formatted conversation
     - **summary**: Optional client-generated summary
-    - **generate_ai_summary**: Whether to generate AI summary using GPT-4
+    - **generate_ai_summary**: Generate an AI summary using GPT-4 in the background;
+      responds with 202 (`ai_summary` is null) and the summary is stored on the
+      context once ready
     - **source_metadata**: Optional metadata about source
     """
     try:
         created_context = await context_service.create_context(db, context)
+        ai_summary = created_context.summary
+        if context.generate_ai_summary:
+            background_tasks.add_task(
+                context_service.summarize_context,
+                created_context.id,
+                context.messages,
+                context.summary,
+            )
+            response.status_code = 202
+            # Not generated yet; the client summary is not an AI summary
+            ai_summary = None
         return ContextCreateResponse(
             success=True,
             context_id=created_context.id,
             message_count=created_context.message_count,
-            ai_summary=created_context.summary,
+            ai_summary=ai_summary,
             created_at=created_context.created_at,
             url=f"/api/v1/contexts/{created_context.id}",
         )
@@ -48,7 +70,7 @@ async def create_context(
 
 
 @router.get("/contexts/{context_id}", response_model=ContextResponse)
-async def get_context(context_id: str, db: AsyncSession = Depends(get_db)):
+async def get_context(context_id: UUID, db: AsyncSession = Depends(get_db)):
     """
     Retrieve a specific context with all messages.
 
@@ -58,9 +80,9 @@ async def get_context(context_id: str, db: AsyncSession = Depends(get_db)):
     if not context:
         raise HTTPException(status_code=404, detail="Context not found")
 
-    # Convert messages to response format
+    # Convert messages to response format (ORM data is trusted, skip validation)
     message_responses = [
-        MessageResponse(
+        MessageResponse.model_construct(
             id=msg.id,
             role=msg.role,
             content=msg.content,
@@ -75,7 +97,7 @@ async def get_context(context_id: str, db: AsyncSession = Depends(get_db)):
         platform=context.platform,
         message_count=context.message_count,
         messages=message_responses,
-        formatted=context.formatted_text,
+        formatted=context.formatted,
         summary=context.summary,
         created_at=context.created_at,
         updated_at=context.updated_at,
@@ -88,22 +110,35 @@ async def list_contexts(
         None, pattern="^(chatgpt|claude|gemini|poe)$", description="Filter by platform"
     ),
     limit: int = Query(20, ge=1, le=100, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    include_total: bool = Query(False, description="Include total count of matches"),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    List contexts with pagination and optional filtering.
+    List contexts with cursor pagination and optional filtering.
 
     - **platform**: Optional filter by AI platform
     - **limit**: Maximum results to return (1-100)
-    - **offset**: Offset for pagination
+    - **cursor**: Opaque `next_cursor` value from the previous page
+    - **include_total**: Also return the total number of matching contexts
     """
-    contexts, total = await context_service.list_contexts(
-        db, platform=platform, limit=limit, offset=offset
+    position = None
+    if cursor:
+        try:
+            position = context_service.decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    contexts, has_more, total = await context_service.list_contexts(
+        db,
+        platform=platform,
+        limit=limit,
+        cursor=position,
+        include_total=include_total,
     )
 
     context_items = [
-        ContextListItem(
+        ContextListItem.model_construct(
             id=c.id,
             platform=c.platform,
             message_count=c.message_count,
@@ -113,17 +148,19 @@ async def list_contexts(
         for c in contexts
     ]
 
+    next_cursor = context_service.encode_cursor(contexts[-1]) if has_more else None
+
     return ContextListResponse(
         contexts=context_items,
         total=total,
         limit=limit,
-        offset=offset,
-        has_more=offset + limit < total,
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
 
 
 @router.delete("/contexts/{context_id}", status_code=204)
-async def delete_context(context_id: str, db: AsyncSession = Depends(get_db)):
+async def delete_context(context_id: UUID, db: AsyncSession = Depends(get_db)):
     """
     Delete a context and all associated messages.
 
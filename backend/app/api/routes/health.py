@@ -34,7 +34,7 @@ async def health_check(db: AsyncSession = Depends(get_db)):
 
     # Check OpenAI configuration
     openai_status = "not_configured"
-    if await is_openai_available():
+    if is_openai_available():
         openai_status = "configured"
 
     # Overall status
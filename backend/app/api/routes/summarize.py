@@ -19,7 +19,7 @@ async def summarize_messages(request: SummarizeRequest):
     This endpoint can be used independently to get AI summaries
     without saving the context to the database.
     """
-    if not await is_openai_available():
+    if not is_openai_available():
         raise HTTPException(
             status_code=503,
             detail="OpenAI API is not configured. Please set OPENAI_API_KEY environment variable.",
@@ -10,6 +10,9 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite+aiosqlite:///./ai_context_bridge.db"
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg only
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 256  # asyncpg only
+    DATABASE_POOL_WARMUP: int = 1  # Connections opened per worker at startup
 
     # OpenAI
     OPENAI_API_KEY: str = ""
@@ -26,6 +29,13 @@ class Settings(BaseSettings):
     MAX_MESSAGES_PER_CONTEXT: int = 500
     DEFAULT_RETENTION_DAYS: int = 30
 
+    # Response caching (in-memory, per worker; only safe with a single worker)
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_TTL: int = 60  # seconds
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024  # 1MB
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32MB per worker
+
     # Rate Limiting (no auth, so IP-based)
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 3600  # 1 hour in seconds
@@ -37,6 +47,7 @@ class Settings(BaseSettings):
 
     # Environment
     ENV: str = "development"  # development, production
+    CREATE_TABLES: bool = False  # Run create_all at startup outside development
 
     class Config:
         env_file = ".env"
@@ -1,14 +1,31 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy import text
+import asyncio
+import logging
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+IS_POSTGRES = "postgresql" in settings.DATABASE_URL
+POOL_SIZE = settings.DATABASE_POOL_SIZE if IS_POSTGRES else 5
+
+# asyncpg keeps prepared statements per connection; size both cache layers
+connect_args = {}
+if IS_POSTGRES:
+    connect_args = {
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.LOG_LEVEL == "debug",
-    pool_size=settings.DATABASE_POOL_SIZE if "postgresql" in settings.DATABASE_URL else 5,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW if "postgresql" in settings.DATABASE_URL else 10,
+    pool_size=POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW if IS_POSTGRES else 10,
     pool_pre_ping=True,
+    connect_args=connect_args,
 )
 
 # Create async session factory
@@ -35,3 +52,26 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+async def warm_up_pool():
+    """
+    Open a few pooled connections up front so early requests
+    don't pay the connection setup cost.
+
+    Every worker runs this, so the count stays small (DATABASE_POOL_WARMUP)
+    and failures are logged rather than aborting startup.
+    """
+    count = min(settings.DATABASE_POOL_WARMUP, POOL_SIZE)
+    if count <= 0:
+        return
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(ping() for _ in range(count)))
+        logger.info(f"Warmed up {count} database connection(s)")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
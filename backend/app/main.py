@@ -4,8 +4,9 @@ from contextlib import asynccontextmanager
 import logging
 
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, Base, warm_up_pool
 from app.api.routes import contexts, summarize, health
+from app.middleware.cache import ResponseCacheMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -20,11 +21,13 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     """
-    # Startup: Create tables if not exist
+    # Startup: Create tables if not exist (production schema is managed by Alembic)
     logger.info("Starting up AI Context Bridge API...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables created/verified")
+    if settings.ENV == "development" or settings.CREATE_TABLES:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("Database tables created/verified")
+    await warm_up_pool()
 
     yield
 
@@ -43,6 +46,19 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Response caching for context reads (registered first so CORS wraps it).
+# The cache is per process and only invalidated locally, so it is opt-in and
+# meant for single-worker setups.
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        cached_prefixes=["/api/v1/contexts"],
+        ttl=settings.RESPONSE_CACHE_TTL,
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        max_entry_bytes=settings.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+        max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    )
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+CacheEntry = Tuple[float, int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ResponseCacheMiddleware:
+    """
+    In-memory response cache for GET requests under the given path prefixes.
+
+    Responses are keyed on path + query string and kept for `ttl` seconds.
+    A successful write request under a cached prefix (create, delete) clears
+    that prefix, but only in the process that handled it: with several
+    workers or instances, others keep serving their copy until it expires.
+    Only enable it for single-worker setups (RESPONSE_CACHE_ENABLED).
+
+    Clients can bypass the cache with a `Cache-Control: no-cache` request header.
+    Bodies larger than `max_entry_bytes` are streamed through uncached, and the
+    total cached body size is capped at `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        app,
+        cached_prefixes: Iterable[str],
+        ttl: int = 60,
+        max_entries: int = 256,
+        max_entry_bytes: int = 1024 * 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+    ):
+        self.app = app
+        self.cached_prefixes = tuple(cached_prefixes)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.cached_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in ("POST", "PUT", "PATCH", "DELETE"):
+            await self._call_and_invalidate(scope, receive, send)
+            return
+
+        if scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        key = scope["path"]
+        if scope.get("query_string"):
+            key += "?" + scope["query_string"].decode("latin-1")
+
+        if not self._bypass_requested(scope):
+            entry = self._get(key)
+            if entry is not None:
+                await self._send_entry(entry, send, hit=True)
+                return
+
+        await self._call_and_store(key, scope, receive, send)
+
+    def invalidate(self, prefix: str = "") -> None:
+        """
+        Drop every cached response whose key starts with prefix.
+
+        Args:
+            prefix: Path prefix to clear (empty string clears everything)
+        """
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            self._remove(key)
+
+    def _bypass_requested(self, scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"cache-control" and b"no-cache" in value.lower():
+                return True
+        return False
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._total_bytes += len(entry[3])
+        # Evict least recently used entries until both limits hold
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= len(entry[3])
+
+    def _prefix_for(self, path: str) -> str:
+        return next(p for p in self.cached_prefixes if path.startswith(p))
+
+    async def _send_entry(self, entry: CacheEntry, send, hit: bool) -> None:
+        _, status, headers, body = entry
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers + [(b"x-cache", b"HIT" if hit else b"MISS")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def _call_and_store(self, key: str, scope, receive, send) -> None:
+        start = {}
+        chunks = []
+        size = 0
+        passthrough = False
+
+        async def capture(message):
+            nonlocal size, passthrough
+            if message["type"] == "http.response.start":
+                start.update(message)
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                return
+
+            if passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            chunks.append(body)
+            size += len(body)
+
+            if size > self.max_entry_bytes:
+                # Too large to cache; flush what was buffered and stream the rest
+                passthrough = True
+                await send(
+                    {
+                        **start,
+                        "headers": list(start.get("headers", [])) + [(b"x-cache", b"MISS")],
+                    }
+                )
+                await send(
+                    {"type": "http.response.body", "body": b"".join(chunks), "more_body": more_body}
+                )
+                chunks.clear()
+                return
+
+            if not more_body:
+                entry = (
+                    time.monotonic() + self.ttl,
+                    start["status"],
+                    list(start.get("headers", [])),
+                    b"".join(chunks),
+                )
+                self._store(key, entry)
+                await self._send_entry(entry, send, hit=False)
+
+        await self.app(scope, receive, capture)
+
+    async def _call_and_invalidate(self, scope, receive, send) -> None:
+        prefix = self._prefix_for(scope["path"])
+        succeeded = False
+
+        async def forward(message):
+            nonlocal succeeded
+            if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                succeeded = True
+                self.invalidate(prefix)
+                logger.debug(f"Invalidated cached responses under {prefix}")
+            await send(message)
+
+        await self.app(scope, receive, forward)
+
+        # Background tasks run after the response is sent but before the app
+        # call returns; clear again so their writes are not masked by the cache
+        if succeeded:
+            self.invalidate(prefix)
@@ -1,36 +1,89 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, JSON, Index, LargeBinary, Uuid
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import expression
 from datetime import datetime, timedelta
 import uuid
 from app.database import Base
 from app.config import settings
+from app.utils.compression import decompress_text
 
 
-def generate_uuid():
-    """Generate UUID as string for compatibility across databases"""
-    return str(uuid.uuid4())
+class utcnow(expression.FunctionElement):
+    """Server-side current UTC timestamp, rendered per database dialect"""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # Match SQLAlchemy's SQLite DateTime storage format (microsecond precision)
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
 
 
 class Context(Base):
     __tablename__ = "contexts"
 
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    platform = Column(String(20), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)  # UUID on PostgreSQL, CHAR(32) elsewhere
+    platform = Column(String(20), nullable=False)
     message_count = Column(Integer, nullable=False)
-    formatted_text = Column(Text, nullable=False)
+    formatted_text = Column(Text)  # Uncompressed, only set on legacy rows
+    formatted_text_zstd = Column(LargeBinary)  # zstd-compressed formatted text
     summary = Column(Text)
     ai_summary_metadata = Column(JSON)  # JSONB in PostgreSQL, JSON in SQLite
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    # Retention is configurable at runtime, so it stays a Python-side default
     expires_at = Column(
         DateTime,
         default=lambda: datetime.utcnow() + timedelta(days=settings.DEFAULT_RETENTION_DAYS),
-        index=True,
     )
     source_metadata = Column(JSON)
 
     # Relationships
-    messages = relationship("Message", back_populates="context", cascade="all, delete-orphan")
+    # Implicit lazy loads raise so N+1 queries surface instead of degrading;
+    # load messages explicitly with selectinload()
+    messages = relationship(
+        "Message",
+        back_populates="context",
+        cascade="all, delete-orphan",
+        order_by="Message.sequence_order",
+        lazy="raise_on_sql",
+    )
+
+    __table_args__ = (
+        # Keyset pagination, unfiltered and by platform
+        Index("idx_contexts_created_id", created_at.desc(), id.desc()),
+        Index("idx_platform_created", platform, created_at.desc(), id.desc()),
+        # Expiry cleanup only ever looks at rows that can expire
+        Index(
+            "idx_expires_partial",
+            expires_at,
+            postgresql_where=expires_at.isnot(None),
+            sqlite_where=expires_at.isnot(None),
+        ),
+    )
+
+    # Fetch server-generated timestamps via RETURNING on insert/update
+    __mapper_args__ = {"eager_defaults": True}
+
+    @property
+    def formatted(self) -> str:
+        """Formatted conversation text, decompressed if stored with zstd"""
+        if self.formatted_text_zstd is not None:
+            return decompress_text(self.formatted_text_zstd)
+        return self.formatted_text
 
     def __repr__(self):
         return f"<Context(id={self.id}, platform={self.platform}, message_count={self.message_count})>"
@@ -39,13 +92,13 @@ class Context(Base):
 class Message(Base):
     __tablename__ = "messages"
 
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    context_id = Column(String(36), ForeignKey("contexts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    context_id = Column(Uuid, ForeignKey("contexts.id", ondelete="CASCADE"), nullable=False, index=True)
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
     message_timestamp = Column(DateTime, nullable=False)
     sequence_order = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
 
     # Relationships
     context = relationship("Context", back_populates="messages")
@@ -65,7 +118,7 @@ class APIUsage(Base):
     endpoint = Column(String(100), nullable=False, index=True)
     ip_address = Column(String(45))  # IPv6 max length
     user_agent = Column(Text)
-    request_timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    request_timestamp = Column(DateTime, server_default=utcnow(), index=True)
     response_status = Column(Integer)
     processing_time_ms = Column(Integer)
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 from datetime import datetime
+from uuid import UUID
 
 
 class MessageCreate(BaseModel):
@@ -19,7 +20,7 @@ class MessageCreate(BaseModel):
 
 
 class MessageResponse(BaseModel):
-    id: str
+    id: UUID
     role: str
     content: str
     timestamp: datetime
@@ -85,7 +86,7 @@ class ContextCreate(BaseModel):
 
 
 class ContextResponse(BaseModel):
-    id: str
+    id: UUID
     platform: str
     message_count: int
     messages: List[MessageResponse]
@@ -98,7 +99,7 @@ class ContextResponse(BaseModel):
 
 
 class ContextListItem(BaseModel):
-    id: str
+    id: UUID
     platform: str
     message_count: int
     summary: Optional[str]
@@ -109,15 +110,15 @@ class ContextListItem(BaseModel):
 
 class ContextListResponse(BaseModel):
     contexts: List[ContextListItem]
-    total: int
+    total: Optional[int] = None
     limit: int
-    offset: int
+    next_cursor: Optional[str] = None
     has_more: bool
 
 
 class ContextCreateResponse(BaseModel):
     success: bool
-    context_id: str
+    context_id: UUID
     message_count: int
     ai_summary: Optional[str]
     created_at: datetime
@@ -1,20 +1,26 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, insert, update, tuple_
 from sqlalchemy.orm import selectinload
 from datetime import datetime
 from typing import Optional, List, Tuple
+from uuid import UUID, uuid4
+import base64
 import logging
 
+from app.database import AsyncSessionLocal
 from app.models import Context, Message
-from app.schemas import ContextCreate
+from app.schemas import ContextCreate, MessageCreate
 from app.services.openai_service import generate_summary
+from app.utils.compression import compress_text
 
 logger = logging.getLogger(__name__)
 
 
 async def create_context(db: AsyncSession, context_data: ContextCreate) -> Context:
     """
-    Create new context with messages and optional AI summary.
+    Create new context with messages.
+
+    AI summaries are not generated here; see summarize_context.
 
     Args:
         db: Database session
@@ -26,41 +32,22 @@ async def create_context(db: AsyncSession, context_data: ContextCreate) -> Conte
     Raises:
         Exception: If context creation fails
     """
-    # Generate AI summary if requested
-    ai_summary_metadata = None
-    summary = context_data.summary
-
-    if context_data.generate_ai_summary:
-        try:
-            ai_result = await generate_summary(context_data.messages)
-            summary = ai_result["summary"]
-            ai_summary_metadata = {
-                "tokens_used": ai_result["tokens_used"],
-                "model": ai_result["model"],
-                "generated_at": datetime.utcnow().isoformat(),
-            }
-            logger.info(f"Generated AI summary with {ai_result['tokens_used']} tokens")
-        except Exception as e:
-            # Fall back to client summary if AI fails
-            logger.error(f"AI summary failed, using client summary: {e}")
-            if not summary:
-                # Create a basic summary if no client summary provided
-                summary = f"Conversation with {len(context_data.messages)} messages"
+    message_count = len(context_data.messages)
 
     # Create context
     context = Context(
         platform=context_data.platform,
-        message_count=len(context_data.messages),
-        formatted_text=context_data.formatted,
-        summary=summary,
-        ai_summary_metadata=ai_summary_metadata,
+        message_count=message_count,
+        formatted_text_zstd=compress_text(context_data.formatted),
+        summary=context_data.summary,
         source_metadata=context_data.source_metadata,
     )
 
     db.add(context)
-    await db.flush()  # Get context.id
+    await db.flush()  # Get context.id and server-side timestamps
 
     # Create messages
+    rows = []
     for idx, msg in enumerate(context_data.messages):
         # Normalize timestamp to timezone-naive UTC
         # If timezone-aware, convert to UTC and remove tzinfo
@@ -70,28 +57,79 @@ async def create_context(db: AsyncSession, context_data: ContextCreate) -> Conte
             # Convert to UTC and strip timezone info
             timestamp = timestamp.replace(tzinfo=None)
 
-        message = Message(
-            context_id=context.id,
-            role=msg.role,
-            content=msg.content,
-            message_timestamp=timestamp,
-            sequence_order=idx,
+        rows.append(
+            {
+                "id": uuid4(),
+                "context_id": context.id,
+                "role": msg.role,
+                "content": msg.content,
+                "message_timestamp": timestamp,
+                "sequence_order": idx,
+            }
         )
-        db.add(message)
+
+    # Insert all messages in a single executemany round-trip
+    await db.execute(insert(Message), rows)
 
     await db.commit()
-    await db.refresh(context)
 
     logger.info(
-        f"Created context {context.id} with {len(context_data.messages)} messages"
+        f"Created context {context.id} with {message_count} messages"
     )
 
     return context
 
 
-async def get_context(db: AsyncSession, context_id: str) -> Optional[Context]:
+async def summarize_context(
+    context_id: UUID,
+    messages: List[MessageCreate],
+    client_summary: Optional[str] = None,
+) -> None:
     """
-    Retrieve context with messages.
+    Generate an AI summary for a stored context and write it to the row.
+
+    Intended to run as a background task after the context is created, so
+    it opens its own database session.
+
+    Args:
+        context_id: UUID of the context to update
+        messages: Messages to summarize
+        client_summary: Client-provided summary to keep if AI fails
+    """
+    summary = client_summary
+    ai_summary_metadata = None
+
+    try:
+        ai_result = await generate_summary(messages)
+        summary = ai_result["summary"]
+        ai_summary_metadata = {
+            "tokens_used": ai_result["tokens_used"],
+            "model": ai_result["model"],
+            "generated_at": datetime.utcnow().isoformat(),
+        }
+        logger.info(f"Generated AI summary with {ai_result['tokens_used']} tokens")
+    except Exception as e:
+        # Fall back to client summary if AI fails
+        logger.error(f"AI summary failed, using client summary: {e}")
+        if summary:
+            return
+        # Create a basic summary if no client summary provided
+        summary = f"Conversation with {len(messages)} messages"
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Context)
+            .where(Context.id == context_id)
+            .values(summary=summary, ai_summary_metadata=ai_summary_metadata)
+        )
+        await db.commit()
+
+    logger.info(f"Stored summary for context {context_id}")
+
+
+async def get_context(db: AsyncSession, context_id: UUID) -> Optional[Context]:
+    """
+    Retrieve context with messages ordered by sequence.
 
     Args:
         db: Database session
@@ -108,56 +146,99 @@ async def get_context(db: AsyncSession, context_id: str) -> Optional[Context]:
     context = result.scalar_one_or_none()
 
     if context:
-        # Sort messages by sequence order
-        context.messages.sort(key=lambda m: m.sequence_order)
         logger.info(f"Retrieved context {context_id}")
 
     return context
 
 
+def encode_cursor(context: Context) -> str:
+    """
+    Encode the keyset position of a context as an opaque cursor.
+
+    Args:
+        context: Last context of the current page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = f"{context.created_at.isoformat()}|{context.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode an opaque cursor back into its (created_at, id) keyset position.
+
+    Args:
+        cursor: Cursor string returned by a previous list call
+
+    Returns:
+        Tuple of (created_at, context id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, context_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(context_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 async def list_contexts(
     db: AsyncSession,
     platform: Optional[str] = None,
     limit: int = 20,
-    offset: int = 0,
-) -> Tuple[List[Context], int]:
+    cursor: Optional[Tuple[datetime, UUID]] = None,
+    include_total: bool = False,
+) -> Tuple[List[Context], bool, Optional[int]]:
     """
-    List contexts with pagination.
+    List contexts with keyset pagination, newest first.
 
     Args:
         db: Database session
         platform: Optional platform filter
         limit: Number of results to return
-        offset: Offset for pagination
+        cursor: Optional (created_at, id) of the last item of the previous page
+        include_total: Whether to also count all matching contexts
 
     Returns:
-        Tuple of (list of contexts, total count)
+        Tuple of (list of contexts, has more flag, total count or None)
     """
     # Build query
-    query = select(Context).order_by(Context.created_at.desc())
+    query = select(Context).order_by(Context.created_at.desc(), Context.id.desc())
 
     if platform:
         query = query.where(Context.platform == platform)
 
-    # Get total count
-    count_query = select(func.count()).select_from(Context)
-    if platform:
-        count_query = count_query.where(Context.platform == platform)
+    if cursor:
+        query = query.where(tuple_(Context.created_at, Context.id) < cursor)
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    # Only count when explicitly requested
+    total = None
+    if include_total:
+        count_query = select(func.count()).select_from(Context)
+        if platform:
+            count_query = count_query.where(Context.platform == platform)
 
-    # Get paginated results
-    query = query.limit(limit).offset(offset)
+        total_result = await db.execute(count_query)
+        total = total_result.scalar_one()
+
+    # Fetch one extra row to detect whether another page exists
+    query = query.limit(limit + 1)
     result = await db.execute(query)
-    contexts = result.scalars().all()
+    contexts = list(result.scalars().all())
+
+    has_more = len(contexts) > limit
+    contexts = contexts[:limit]
 
-    logger.info(f"Listed {len(contexts)} contexts (total: {total})")
+    logger.info(f"Listed {len(contexts)} contexts (has_more: {has_more})")
 
-    return list(contexts), total
+    return contexts, has_more, total
 
 
-async def delete_context(db: AsyncSession, context_id: str) -> bool:
+async def delete_context(db: AsyncSession, context_id: UUID) -> bool:
     """
     Delete context and cascade delete messages.
 
@@ -168,10 +249,13 @@ async def delete_context(db: AsyncSession, context_id: str) -> bool:
     Returns:
         bool: True if deleted, False if not found
     """
-    result = await db.execute(delete(Context).where(Context.id == context_id))
+    # RETURNING fuses the existence check into the delete itself
+    result = await db.execute(
+        delete(Context).where(Context.id == context_id).returning(Context.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
 
-    deleted = result.rowcount > 0
     if deleted:
         logger.info(f"Deleted context {context_id}")
     else:
@@ -180,22 +264,43 @@ async def delete_context(db: AsyncSession, context_id: str) -> bool:
     return deleted
 
 
-async def cleanup_expired_contexts(db: AsyncSession) -> int:
+async def cleanup_expired_contexts(db: AsyncSession, batch_size: int = 1000) -> int:
     """
-    Delete expired contexts (run as cron job).
+    Delete expired contexts in bounded batches (run as cron job).
+
+    Each batch is committed separately to keep transactions, locks and
+    cascade work small on large backlogs.
 
     Args:
         db: Database session
+        batch_size: Maximum contexts deleted per transaction
 
     Returns:
         int: Number of contexts deleted
     """
-    result = await db.execute(
-        delete(Context).where(Context.expires_at < datetime.utcnow())
-    )
-    await db.commit()
+    now = datetime.utcnow()
+    count = 0
+
+    while True:
+        expired_ids = (
+            select(Context.id)
+            .where(Context.expires_at < now)
+            .order_by(Context.expires_at)
+            .limit(batch_size)
+        )
+        result = await db.execute(
+            delete(Context)
+            .where(Context.id.in_(expired_ids))
+            .returning(Context.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = len(result.all())
+        await db.commit()
+
+        count += deleted
+        if deleted < batch_size:
+            break
 
-    count = result.rowcount
     if count > 0:
         logger.info(f"Cleaned up {count} expired contexts")
 
@@ -2,6 +2,7 @@ from openai import AsyncOpenAI
 from app.config import settings
 from app.schemas import MessageCreate
 from typing import List
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,31 +14,27 @@ if settings.OPENAI_API_KEY:
 else:
     logger.warning("OpenAI API key not configured. AI summarization will not be available.")
 
+# Configuration is fixed after import, so availability is computed once
+OPENAI_AVAILABLE: bool = client is not None and bool(settings.OPENAI_API_KEY)
 
-async def generate_summary(messages: List[MessageCreate], max_tokens: int = 150) -> dict:
+
+def _build_prompt(messages: List[MessageCreate]) -> str:
     """
-    Generate AI summary using GPT-4.
+    Build the summarization prompt for a conversation.
 
     Args:
         messages: List of messages to summarize
-        max_tokens: Maximum tokens for summary
 
     Returns:
-        dict with 'summary', 'tokens_used', 'model'
-
-    Raises:
-        Exception: If OpenAI API call fails
+        str: Prompt text including the full conversation
     """
-    if not client:
-        raise Exception("OpenAI API key not configured")
-
     # Construct conversation text
     conversation_text = "\n\n".join(
         [f"{msg.role.upper()}: {msg.content}" for msg in messages]
     )
 
     # Create prompt
-    prompt = f"""Summarize the following conversation concisely. Focus on:
+    return f"""Summarize the following conversation concisely. Focus on:
 1. Main topics discussed
 2. Key questions asked
 3. Important conclusions or decisions
@@ -48,6 +45,27 @@ Conversation:
 
 Provide a summary in 2-3 sentences that captures the essence of this conversation."""
 
+
+async def generate_summary(messages: List[MessageCreate], max_tokens: int = 150) -> dict:
+    """
+    Generate AI summary using GPT-4.
+
+    Args:
+        messages: List of messages to summarize
+        max_tokens: Maximum tokens for summary
+
+    Returns:
+        dict with 'summary', 'tokens_used', 'model'
+
+    Raises:
+        Exception: If OpenAI API call fails
+    """
+    if not client:
+        raise Exception("OpenAI API key not configured")
+
+    # Joining up to 500 large messages is CPU/memory heavy; keep it off the event loop
+    prompt = await asyncio.to_thread(_build_prompt, messages)
+
     try:
         response = await client.chat.completions.create(
             model=settings.OPENAI_MODEL,
@@ -79,11 +97,11 @@ Provide a summary in 2-3 sentences that captures the essence of this conversatio
         raise Exception(f"Failed to generate AI summary: {str(e)}")
 
 
-async def is_openai_available() -> bool:
+def is_openai_available() -> bool:
     """
     Check if OpenAI API is available and configured.
 
     Returns:
         bool: True if OpenAI is available
     """
-    return client is not None and settings.OPENAI_API_KEY != ""
+    return OPENAI_AVAILABLE
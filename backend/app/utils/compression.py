@@ -0,0 +1,33 @@
+import zstandard
+
+# Reused across calls to avoid per-call context setup. zstandard objects
+# must not be used concurrently from multiple threads; these are only
+# called from the event loop.
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def compress_text(text: str) -> bytes:
+    """
+    Compress text with zstd for storage.
+
+    Args:
+        text: Text to compress
+
+    Returns:
+        bytes: zstd frame containing the UTF-8 encoded text
+    """
+    return _compressor.compress(text.encode("utf-8"))
+
+
+def decompress_text(data: bytes) -> str:
+    """
+    Decompress text previously stored with compress_text.
+
+    Args:
+        data: zstd frame
+
+    Returns:
+        str: Original text
+    """
+    return _decompressor.decompress(data).decode("utf-8")
@@ -0,0 +1,166 @@
+import asyncio
+
+from app.middleware.cache import ResponseCacheMiddleware
+
+
+class FakeApp:
+    """Minimal ASGI app that counts calls and returns a configurable response"""
+
+    def __init__(self, status=200, body=b'{"ok": true}', chunks=None):
+        self.status = status
+        self.body = body
+        self.chunks = chunks
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        chunks = self.chunks or [self.body]
+        for i, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": i < len(chunks) - 1,
+                }
+            )
+
+
+def request(app, method="GET", path="/api/v1/contexts", query=b"", headers=None):
+    """Run one request through an ASGI app; return (status, headers, body)"""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": headers or [],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    start = messages[0]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], dict(start["headers"]), body
+
+
+def make_cache(inner, **kwargs):
+    return ResponseCacheMiddleware(inner, cached_prefixes=["/api/v1/contexts"], **kwargs)
+
+
+def test_second_get_is_served_from_cache():
+    inner = FakeApp()
+    cache = make_cache(inner)
+
+    status, headers, body = request(cache)
+    assert (status, headers[b"x-cache"], body) == (200, b"MISS", b'{"ok": true}')
+
+    status, headers, body = request(cache)
+    assert (status, headers[b"x-cache"], body) == (200, b"HIT", b'{"ok": true}')
+    assert inner.calls == 1
+    assert b"cache-control" not in headers
+
+
+def test_query_string_is_part_of_the_key():
+    inner = FakeApp()
+    cache = make_cache(inner)
+
+    request(cache, query=b"limit=1")
+    request(cache, query=b"limit=2")
+    assert inner.calls == 2
+
+
+def test_successful_write_invalidates_prefix():
+    inner = FakeApp()
+    cache = make_cache(inner)
+    request(cache)
+
+    cache.app = FakeApp(status=201)
+    request(cache, method="POST")
+
+    cache.app = inner
+    _, headers, _ = request(cache)
+    assert headers[b"x-cache"] == b"MISS"
+    assert inner.calls == 2
+
+
+def test_failed_write_keeps_cache():
+    inner = FakeApp()
+    cache = make_cache(inner)
+    request(cache)
+
+    cache.app = FakeApp(status=404)
+    request(cache, method="DELETE", path="/api/v1/contexts/abc")
+
+    cache.app = inner
+    _, headers, _ = request(cache)
+    assert headers[b"x-cache"] == b"HIT"
+
+
+def test_non_200_responses_pass_through_uncached():
+    inner = FakeApp(status=404, body=b'{"detail": "Context not found"}')
+    cache = make_cache(inner)
+
+    for _ in range(2):
+        status, headers, body = request(cache, path="/api/v1/contexts/abc")
+        assert status == 404
+        assert body == b'{"detail": "Context not found"}'
+        assert b"x-cache" not in headers
+    assert inner.calls == 2
+
+
+def test_no_cache_header_bypasses_cache():
+    inner = FakeApp()
+    cache = make_cache(inner)
+    request(cache)
+
+    _, headers, _ = request(cache, headers=[(b"cache-control", b"no-cache")])
+    assert headers[b"x-cache"] == b"MISS"
+    assert inner.calls == 2
+
+
+def test_paths_outside_prefix_are_not_cached():
+    inner = FakeApp()
+    cache = make_cache(inner)
+
+    request(cache, path="/api/v1/health")
+    _, headers, _ = request(cache, path="/api/v1/health")
+    assert b"x-cache" not in headers
+    assert inner.calls == 2
+
+
+def test_oversized_body_is_streamed_and_not_stored():
+    inner = FakeApp(chunks=[b"a" * 6, b"b" * 6, b"c" * 6])
+    cache = make_cache(inner, max_entry_bytes=10)
+
+    status, headers, body = request(cache)
+    assert (status, headers[b"x-cache"]) == (200, b"MISS")
+    assert body == b"a" * 6 + b"b" * 6 + b"c" * 6
+
+    request(cache)
+    assert inner.calls == 2
+    assert cache._total_bytes == 0
+
+
+def test_total_bytes_cap_evicts_least_recently_used():
+    inner = FakeApp(body=b"x" * 10)
+    cache = make_cache(inner, max_bytes=25)
+
+    request(cache, query=b"page=1")
+    request(cache, query=b"page=2")
+    request(cache, query=b"page=3")
+
+    assert cache._total_bytes <= 25
+    assert list(cache._entries) == ["/api/v1/contexts?page=2", "/api/v1/contexts?page=3"]
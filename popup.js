@@ -135,7 +135,10 @@ Transferred using AI Context Bridge`;
     try {
       setStatus('Saving to cloud...', 'loading');
       const result = await saveToCloud(extractedData);
-      setStatus(`Saved to cloud! AI Summary: ${result.ai_summary || 'N/A'}`, 'success');
+      const summaryStatus = result.ai_summary
+        ? `AI Summary: ${result.ai_summary}`
+        : 'AI summary is being generated';
+      setStatus(`Saved to cloud! ${summaryStatus}`, 'success');
 
       // Store cloud context ID
       chrome.storage.local.set({